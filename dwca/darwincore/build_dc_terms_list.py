@@ -19,22 +19,33 @@ parser = argparse.ArgumentParser(
 
 # Required positional argument: one or more XML files to be read
 parser.add_argument("source_xml", nargs="+", type=argparse.FileType("r"))
-parser.parse_args()
 args = parser.parse_args()
 
 # Use a set to remove possible duplicates
 qualnames = set()
 
 for source_file in args.source_xml:
-    root = ET.parse(source_file).getroot()
-    # First, extract the RowType itself... (Occcurrence, Taxon, ...)
+    # Stream the file instead of building the whole tree: we only need a few attributes.
+    context = ET.iterparse(source_file, events=("start", "end"))
+
+    # First, extract the RowType itself (on the root element)... (Occcurrence, Taxon, ...)
+    _, root = next(context)
     qualnames.add(root.get("rowType"))
 
     # Store each qualname found in any tag to our set
-    for ch in root.iter():
-        qn = ch.get("qualName")
-        if qn:
-            qualnames.add(qn)
+    depth = 0  # Of the current element, below the root
+    for event, elem in context:
+        if event == "start":
+            depth += 1
+            qn = elem.get("qualName")
+            if qn:
+                qualnames.add(qn)
+        else:
+            depth -= 1
+            if depth == 0:
+                # A top-level child of the root is complete: drop it (and its descendants) so
+                # memory doesn't grow with the size of the file.
+                root.clear()
 
 # Turn set to list and add the variable name in front so output can directly be
 # redirected in a file (quick'n'dirty)
@@ -2,8 +2,19 @@
 
 """
 
+import sys
+
 from .terms import TERMS
 
+# Short name => qualname, built once so qualname() doesn't have to scan TERMS on each call.
+# TERMS is iterated backwards so the first matching term wins, like the original linear scan.
+#
+# Qualnames are interned, as are the terms read from metafiles (see dwca.descriptors): row.data
+# lookups such as row.data[qualname('locality')] then match keys by identity.
+_QUALNAMES_BY_SHORT_TERM = {
+    t.rsplit("/", 1)[-1]: sys.intern(t) for t in reversed(TERMS)
+}
+
 
 def qualname(short_term):
     """Takes a darwin core term (short form) and returns the corresponding qualname.
@@ -29,4 +40,7 @@ def qualname(short_term):
 
     """
 
-    return next(t for t in TERMS if t.endswith("/" + short_term))
+    try:
+        return _QUALNAMES_BY_SHORT_TERM[short_term]
+    except KeyError:
+        raise StopIteration from None
@@ -11,13 +11,16 @@ introspecting the CSV data file (useful for Archives without metafile).
 import csv
 import io
 import os
-import re
+import sys
 import xml.etree.ElementTree as ET
-from typing import Optional, List, Dict, Set
+from typing import Optional, List, Dict, FrozenSet
 from xml.etree.ElementTree import Element
 
 from dwca.exceptions import InvalidArchive
 
+# Maximum number of characters of the header line given to csv.Sniffer by make_from_file()
+_SNIFFER_SAMPLE_SIZE = 8192
+
 
 class DataFileDescriptor(object):
     """Those objects describe a data file fom the archive.
@@ -28,6 +31,27 @@ class DataFileDescriptor(object):
         * :meth:`make_from_file` (created by analyzing the data file)
     """
 
+    __slots__ = (
+        "created_from_file",
+        "raw_element",
+        "represents_corefile",
+        "type",
+        "file_location",
+        "file_encoding",
+        "id_index",
+        "coreid_index",
+        "fields",
+        "_indexed_fields",
+        "_default_data",
+        "_terms",
+        "lines_terminated_by",
+        "fields_enclosed_by",
+        "fields_terminated_by",
+        "_headers",
+        "_short_headers",
+        "_lines_to_ignore",
+    )
+
     def __init__(
         self,
         created_from_file: bool,
@@ -50,8 +74,6 @@ class DataFileDescriptor(object):
         self.raw_element = raw_element
         #: True if this descriptor is used to represent the core file an archive.
         self.represents_corefile = represents_corefile
-        #: True if this descriptor is used to represent an extension file in an archive.
-        self.represents_extension = not represents_corefile
         #:
         self.type = datafile_type
         #: The data file location, relative to the archive root.
@@ -90,6 +112,17 @@ class DataFileDescriptor(object):
         #:        'index': None,
         #:        'default': 'Belgium'}]
         self.fields = fields
+        # The same information, in shapes that code running for each row can use without
+        # dict lookups on self.fields. First, (term, column index) for the fields having a
+        # column in the data file.
+        self._indexed_fields = tuple(
+            (f["term"], int(f["index"])) for f in fields if f["index"] is not None
+        )
+        # Template for Row.data, before the values found in the row are filled in
+        self._default_data = {
+            f["term"]: f["default"] or "" for f in fields
+        }  # type: Dict[str, str]
+        self._terms = frozenset(f["term"] for f in fields)  # type: FrozenSet[str]
 
         #: The string or character used as a line separator in the data file. Example: "\\n".
         self.lines_terminated_by = lines_terminated_by
@@ -98,6 +131,10 @@ class DataFileDescriptor(object):
         #: The string or character used as a field separator in the data file. Example: "\\t".
         self.fields_terminated_by = fields_terminated_by
 
+        self._headers = None  # type: Optional[List[str]]
+        self._short_headers = None  # type: Optional[List[str]]
+        self._lines_to_ignore = None  # type: Optional[int]
+
     @classmethod
     def make_from_file(cls, datafile_path):
         """Create and return a DataFileDescriptor by analyzing the file at datafile_path.
@@ -108,14 +145,23 @@ class DataFileDescriptor(object):
         """
         file_encoding = "utf-8"
 
-        with io.open(datafile_path, "r", encoding=file_encoding) as datafile:
-            # Autodetect fields/lines termination
-            dialect = csv.Sniffer().sniff(datafile.readline())
+        # newline="" keeps the line endings untranslated, as recommended for the csv module.
+        with io.open(
+            datafile_path, "r", encoding=file_encoding, newline=""
+        ) as datafile:
+            first_line = datafile.readline()
 
             # Normally, EOL characters should be available in dialect.lineterminator, but it
-            # seems it always returns \r\n. The workaround therefore consists to open the file
-            # in universal-newline mode, which adds a newlines attribute.
-            lines_terminated_by = datafile.newlines
+            # seems it always returns \r\n. We therefore look at how the first line ends.
+            lines_terminated_by = _line_terminator(first_line)
+
+            # Autodetect fields termination (on the line as it would be read in universal-newline
+            # mode, the sniffer expects \n line endings).
+            if lines_terminated_by is not None:
+                first_line = first_line[: -len(lines_terminated_by)] + "\n"
+            # The sniffer's regular expressions can get very slow on long input, a bounded sample
+            # of the header line is enough to detect the delimiter and quote character.
+            dialect = csv.Sniffer().sniff(first_line[:_SNIFFER_SAMPLE_SIZE])
 
             fields_terminated_by = dialect.delimiter
             fields_enclosed_by = dialect.quotechar
@@ -126,7 +172,7 @@ class DataFileDescriptor(object):
             columns = next(dr)
 
             fields = [
-                {"index": i, "term": column, "default": None}
+                {"index": i, "term": sys.intern(column), "default": None}
                 for i, column in enumerate(columns)
             ]
 
@@ -162,34 +208,41 @@ class DataFileDescriptor(object):
             coreid_index = int(section_tag.find("coreid").get("index"))
 
         fields = []
-        for field_tag in section_tag.findall("field"):
-            default = field_tag.get("default", None)
+        for field_tag in section_tag.iterfind("field"):
+            field_attributes = field_tag.attrib
 
             # Default fields don't have an index attribute
-            index = int(field_tag.get("index")) if field_tag.get("index") else None
+            index = field_attributes.get("index")
 
             fields.append(
-                {"term": field_tag.get("term"), "index": index, "default": default}
+                {
+                    "term": _intern_optional(field_attributes.get("term")),
+                    "index": int(index) if index else None,
+                    "default": field_attributes.get("default"),
+                }
             )
 
-        file_encoding = section_tag.get("encoding")
+        # The encoding and row type are shared by many descriptors (and the row type is compared to
+        # extension types): intern them like the terms.
+        section_attributes = section_tag.attrib
+        file_encoding = _intern_optional(section_attributes.get("encoding"))
 
         lines_terminated_by = _decode_xml_attribute(
-            raw_element=section_tag,
+            attributes=section_attributes,
             attribute_name="linesTerminatedBy",
             default_value="\n",
             encoding=file_encoding,
         )
 
         fields_terminated_by = _decode_xml_attribute(
-            raw_element=section_tag,
+            attributes=section_attributes,
             attribute_name="fieldsTerminatedBy",
             default_value="\t",
             encoding=file_encoding,
         )
 
         fields_enclosed_by = _decode_xml_attribute(
-            raw_element=section_tag,
+            attributes=section_attributes,
             attribute_name="fieldsEnclosedBy",
             default_value="",
             encoding=file_encoding,
@@ -199,7 +252,7 @@ class DataFileDescriptor(object):
             created_from_file=False,
             raw_element=section_tag,
             represents_corefile=(section_tag.tag == "core"),
-            datafile_type=section_tag.get("rowType"),
+            datafile_type=_intern_optional(section_attributes.get("rowType")),
             file_location=section_tag.find("files").find("location").text,
             file_encoding=file_encoding,
             id_index=id_index,
@@ -211,9 +264,14 @@ class DataFileDescriptor(object):
         )
 
     @property
-    def terms(self) -> Set[str]:
-        """Return a Python set containing all the Darwin Core terms appearing in file."""
-        return set([f["term"] for f in self.fields])
+    def represents_extension(self) -> bool:
+        """True if this descriptor is used to represent an extension file in an archive."""
+        return not self.represents_corefile
+
+    @property
+    def terms(self) -> FrozenSet[str]:
+        """Return a Python frozenset containing all the Darwin Core terms appearing in file."""
+        return self._terms
 
     @property
     def headers(self) -> List[str]:
@@ -225,22 +283,37 @@ class DataFileDescriptor(object):
             'http://rs.tdwg.org/dwc/terms/family', 'http://rs.tdwg.org/dwc/terms/locality']
 
         See also :py:attr:`short_headers` if you prefer less verbose headers.
+
+        .. note::
+
+            The headers are computed at first access and then cached. Each access returns a new list,
+            that can be modified without affecting the descriptor.
         """
-        columns = {}
+        if self._headers is None:
+            self._headers = self._build_headers()
+
+        return list(self._headers)
 
-        for f in self.fields:
-            if f[
-                "index"
-            ]:  # Some (default values for example) don't have a corresponding col.
-                columns[f["index"]] = f["term"]
+    def _build_headers(self) -> List[str]:
+        # (index, column name) pairs, the id/coreid columns last so they replace any field declared
+        # at the same index.
+        # Fields with a default value but no column are not in _indexed_fields. Fields at index 0
+        # (normally the id column) don't get a header either.
+        named_columns = [(index, term) for term, index in self._indexed_fields if index]
 
         # In addition to DwC terms, we may also have id (Core) or core_id (Extensions) columns
         if self.id_index is not None:
-            columns[self.id_index] = "id"
+            named_columns.append((self.id_index, "id"))
         if self.coreid_index is not None:
-            columns[self.coreid_index] = "coreid"
+            named_columns.append((self.coreid_index, "coreid"))
+
+        if not named_columns:
+            return []
 
-        return [columns[f] for f in sorted(columns.keys())]
+        # Walk the positions up to the last column: no sorting needed. A dict rather than a list
+        # with None placeholders, since a field without a term attribute is named None.
+        columns = dict(named_columns)  # type: Dict[int, str]
+        return [columns[i] for i in range(max(columns) + 1) if i in columns]
 
     @property
     def short_headers(self) -> List[str]:
@@ -252,30 +325,51 @@ class DataFileDescriptor(object):
 
         See also :py:attr:`headers`.
         """
-        return [shorten_term(long_term) for long_term in self.headers]
+        if self._short_headers is None:
+            self._short_headers = [
+                shorten_term(long_term) for long_term in self.headers
+            ]
+
+        return list(self._short_headers)
 
     @property
     def lines_to_ignore(self) -> int:
         """Return the number of header lines/lines to ignore in the data file."""
-        if self.created_from_file:
-            # Single-file archives always have a header line with DwC terms
-            return 1
+        if self._lines_to_ignore is None:
+            if self.created_from_file:
+                # Single-file archives always have a header line with DwC terms
+                self._lines_to_ignore = 1
+            else:
+                self._lines_to_ignore = int(
+                    self.raw_element.get("ignoreHeaderLines", 0)
+                )
 
-        return int(self.raw_element.get("ignoreHeaderLines", 0))
+        return self._lines_to_ignore
 
 
 class ArchiveDescriptor(object):
     """Class used to encapsulate the whole Metafile (`meta.xml`)."""
 
+    __slots__ = (
+        "raw_element",
+        "metadata_filename",
+        "core",
+        "extensions",
+        "extensions_type",
+    )
+
     def __init__(self, metaxml_content: str, files_to_ignore: List[str] = None) -> None:
         if files_to_ignore is None:
             files_to_ignore = []
-
-        # Let's drop the XML namespace to avoid prefixes
-        metaxml_content = re.sub(' xmlns="[^"]+"', "", metaxml_content, count=1)
+        elif isinstance(files_to_ignore, str):  # A single file name
+            files_to_ignore = [files_to_ignore]
+        # We only test membership, a set does that in constant time
+        ignored_files = frozenset(files_to_ignore)
 
         #: A :class:`xml.etree.ElementTree.Element` instance containing the complete Archive Descriptor.
         self.raw_element = ET.fromstring(metaxml_content)  # type: Element
+        # Let's drop the XML namespace to avoid prefixes
+        _strip_default_namespace(self.raw_element)
 
         #: The path (relative to archive root) of the (scientific) metadata of the archive.
         self.metadata_filename = self.raw_element.get("metadata", None)
@@ -289,38 +383,77 @@ class ArchiveDescriptor(object):
         #: A list of :class:`dwca.descriptors.DataFileDescriptor` instances describing each of the archive's extension
         #: data files.
         self.extensions = []  # type: List[DataFileDescriptor]
+
+        #: A list of extension (types) in use in the archive.
+        #:
+        #: Example::
+        #:
+        #:     ["http://rs.gbif.org/terms/1.0/VernacularName",
+        #:      "http://rs.gbif.org/terms/1.0/Description"]
+        self.extensions_type = []  # type: List[Optional[str]]
+
         for extension_tag in self.raw_element.findall("extension"):  # type: Element
             location_tag = extension_tag.find("./files/location")
             if location_tag is not None:
                 extension_filename = location_tag.text
-                if extension_filename not in files_to_ignore:
-                    self.extensions.append(
-                        DataFileDescriptor.make_from_metafile_section(extension_tag)
+                if extension_filename not in ignored_files:
+                    extension = DataFileDescriptor.make_from_metafile_section(
+                        extension_tag
                     )
+                    self.extensions.append(extension)
+                    self.extensions_type.append(extension.type)
             else:
                 raise InvalidArchive(
                     "An extension file is referenced in Metafile, but its path is not specified."
                 )
 
-        #: A list of extension (types) in use in the archive.
-        #:
-        #: Example::
-        #:
-        #:     ["http://rs.gbif.org/terms/1.0/VernacularName",
-        #:      "http://rs.gbif.org/terms/1.0/Description"]
-        self.extensions_type = [e.type for e in self.extensions]
+
+def _strip_default_namespace(root_element):
+    # Remove the namespace of root_element (typically http://rs.tdwg.org/dwc/text/) from the tag
+    # of all elements sharing it, so they can be found with find("core"), findall("field"), ...
+    if root_element.tag.startswith("{"):
+        prefix = root_element.tag[: root_element.tag.index("}") + 1]
+        for element in root_element.iter():
+            if element.tag.startswith(prefix):
+                element.tag = element.tag[len(prefix) :]
+
+
+def _intern_optional(value):
+    # sys.intern() that lets None (missing XML attribute) through.
+    return sys.intern(value) if value is not None else None
 
 
 def shorten_term(long_term):
-    return long_term.split("/")[-1]
+    return long_term.rpartition("/")[2]
+
+
+def _line_terminator(line):
+    # Return the line terminator ("\r\n", "\n" or "\r") found at the end of line, or None if
+    # there's none (single line file).
+    for terminator in ("\r\n", "\n", "\r"):
+        if line.endswith(terminator):
+            return terminator
+
+    return None
+
+
+# Values commonly found in the linesTerminatedBy, fieldsTerminatedBy and fieldsEnclosedBy
+# attributes, already decoded.
+_COMMON_DECODED_ATTRIBUTES = {
+    v.encode("unicode-escape").decode("ascii"): v
+    for v in ("\t", "\n", "\r", "\r\n", ",", ";", "|", '"', "'")
+}
 
 
-def _decode_xml_attribute(raw_element, attribute_name, default_value, encoding):
-    # Gets XML attribute and decode it to make it usable. If it doesn't exists, it returns
-    # default_value.
+def _decode_xml_attribute(attributes, attribute_name, default_value, encoding):
+    # Gets XML attribute (from the attrib dict of an element) and decode it to make it usable. If it
+    # doesn't exists, it returns default_value.
 
-    raw_attribute = raw_element.get(attribute_name)
+    raw_attribute = attributes.get(attribute_name)
     if raw_attribute:
-        return bytes(raw_attribute, encoding).decode("unicode-escape")
+        try:
+            return _COMMON_DECODED_ATTRIBUTES[raw_attribute]
+        except KeyError:
+            return sys.intern(bytes(raw_attribute, encoding).decode("unicode-escape"))
 
     return default_value
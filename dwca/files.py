@@ -1,12 +1,14 @@
 """File-related classes and functions."""
 
+import codecs
 import io
 import os
 from array import array
-from typing import List, Union, IO, Dict, Optional
+from itertools import accumulate, chain
+from typing import List, Union, IO, Dict, Optional, Type
 
 from dwca.descriptors import DataFileDescriptor
-from dwca.rows import CoreRow, ExtensionRow, Row
+from dwca.rows import CoreRow, ExtensionRow, Row, _non_existent_field, split_line
 
 
 class CSVDataFile(object):
@@ -49,7 +51,9 @@ class CSVDataFile(object):
         # On init, we parse the file once to build an index of newlines (including lines to ignore)
         # that will make random access faster later on...
         self._line_offsets = _get_all_line_offsets(
-            self._file_stream, self.file_descriptor.file_encoding
+            self._file_stream,
+            self.file_descriptor.file_encoding,
+            self.file_descriptor.lines_terminated_by,
         )
 
         #: Number of lines to ignore (header lines) in the CSV file.
@@ -57,13 +61,26 @@ class CSVDataFile(object):
 
         self._coreid_index = None  # type: Optional[Dict[str, List[int]]]
 
+        # All rows of a data file have the same type, we choose the class once for all.
+        if self.file_descriptor.represents_corefile:
+            self._row_class = CoreRow  # type: Type[Union[CoreRow, ExtensionRow]]
+        else:
+            self._row_class = ExtensionRow
+
+        # Index (in _line_offsets) of the line at the current stream position, if known. When rows
+        # are read one after the other, this allows skipping seek() (that discards the read buffer).
+        self._next_line_index = None  # type: Optional[int]
+
     def __str__(self) -> str:
         return self.file_descriptor.file_location
 
     def _position_file_after_header(self) -> None:
-        self._file_stream.seek(0, 0)
-        if self.lines_to_ignore > 0:
-            self._file_stream.readlines(self.lines_to_ignore)
+        self._next_line_index = None
+        # The offset index tells us where the first data line starts, no need to read the header.
+        if self.lines_to_ignore < len(self._line_offsets):
+            self._file_stream.seek(self._line_offsets[self.lines_to_ignore], 0)
+        else:  # The file has no data lines
+            self._file_stream.seek(0, 2)
 
     def __iter__(self) -> "CSVDataFile":
         self._position_file_after_header()
@@ -73,6 +90,7 @@ class CSVDataFile(object):
         return self.next()
 
     def next(self) -> str:  # NOQA
+        self._next_line_index = None
         for line in self._file_stream:
             return line
 
@@ -108,13 +126,24 @@ class CSVDataFile(object):
         """Build and return an index of Core Rows IDs suitable for `CSVDataFile.coreid_index`."""
         index = {}  # type: Dict[str, array[int]]
 
-        for position, row in enumerate(self):
-            if self.file_descriptor.represents_corefile:
-                tmp = CoreRow(row, position, self.file_descriptor)
-                index.setdefault(tmp.id, array("L")).append(position)
+        descriptor = self.file_descriptor
+        if descriptor.represents_corefile:
+            id_column = descriptor.id_index  # Same value as CoreRow.id
+        else:
+            id_column = descriptor.coreid_index  # Same value as ExtensionRow.core_id
+
+        # Only the id column is needed: we split the lines ourselves rather than building full
+        # Row objects (and their data dict) for every line of the file.
+        for position, line in enumerate(self):
+            if id_column is None:
+                row_id = None
             else:
-                tmp = ExtensionRow(row, position, self.file_descriptor)
-                index.setdefault(tmp.core_id, array("L")).append(position)
+                fields = split_line(line, descriptor)
+                try:
+                    row_id = fields[id_column]
+                except IndexError:
+                    raise _non_existent_field(id_column)
+            index.setdefault(row_id, array("L")).append(position)
 
         return index
 
@@ -136,15 +165,18 @@ class CSVDataFile(object):
         """
 
         line = self._get_line_by_position(position)
-        if self.file_descriptor.represents_corefile:
-            return CoreRow(line, position, self.file_descriptor)
-        else:
-            return ExtensionRow(line, position, self.file_descriptor)
+        return self._row_class(line, position, self.file_descriptor)
 
     # Raises IndexError if position is incorrect
     def _get_line_by_position(self, position: int) -> str:
-        self._file_stream.seek(self._line_offsets[position + self.lines_to_ignore], 0)
-        return self._file_stream.readline()
+        line_index = position + self.lines_to_ignore
+        line_offset = self._line_offsets[line_index]
+        if line_index != self._next_line_index:
+            self._file_stream.seek(line_offset, 0)
+        line = self._file_stream.readline()
+
+        self._next_line_index = line_index + 1 if line_index >= 0 else None
+        return line
 
     def close(self) -> None:
         """Close the file.
@@ -154,7 +186,9 @@ class CSVDataFile(object):
         self._file_stream.close()
 
 
-def _get_all_line_offsets(f: IO, encoding: str) -> array:
+def _get_all_line_offsets(
+    f: io.TextIOWrapper, encoding: str, line_terminator: Optional[str] = None
+) -> array:
     """Parse the file whose handler is given and return an array (long) containing the start offset\
     of each line.
 
@@ -162,7 +196,10 @@ def _get_all_line_offsets(f: IO, encoding: str) -> array:
 
     This function can take long for large files.
 
-    It needs to know the file encoding to properly count the bytes in a given string.
+    It needs to know the file encoding to properly count the bytes in a given string. If the line
+    terminator (as passed to open() as `newline`) is also given and the encoding is ASCII-compatible,
+    the file is scanned in binary mode instead: this avoids decoding it, and the offsets stay
+    exact if it contains undecodable bytes (replaced by U+FFFD in the decoded text).
     """
     f.seek(0, 0)
 
@@ -171,11 +208,77 @@ def _get_all_line_offsets(f: IO, encoding: str) -> array:
     # didn't show any significant slowdown.
     #
     # See mini-benchmark in minibench.py
-    line_offsets = array("L")
-    offset = 0
-    for line in f:
-        line_offsets.append(offset)
-        offset += len(line.encode(encoding))
+    if (
+        line_terminator is not None
+        and line_terminator in _SCANNABLE_LINE_TERMINATORS
+        and _is_ascii_compatible(encoding)
+    ):
+        with io.open(f.name, "rb") as binary_file:
+            line_offsets = _scan_line_offsets(
+                binary_file, line_terminator.encode("ascii")
+            )
+    else:
+        line_offsets = array("L")
+        offset = 0
+        for line in f:
+            line_offsets.append(offset)
+            offset += len(line.encode(encoding))
 
     f.seek(0, 0)
     return line_offsets
+
+
+# Line terminators that TextIOWrapper (opened with newline=...) splits lines on, and that can be
+# searched as is in the bytes of an ASCII-compatible file.
+_SCANNABLE_LINE_TERMINATORS = frozenset(("\n", "\r\n", "\r"))
+
+# Single-byte or UTF-8 encodings: the terminator bytes can't appear inside another character.
+_ASCII_COMPATIBLE_ENCODINGS = frozenset(
+    ("utf-8", "ascii", "iso8859-1", "iso8859-15", "cp1252")
+)
+
+_SCAN_CHUNK_SIZE = 1024 * 1024
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    try:
+        return codecs.lookup(encoding).name in _ASCII_COMPATIBLE_ENCODINGS
+    except LookupError:
+        return False
+
+
+def _scan_line_offsets(binary_file: IO[bytes], terminator: bytes) -> array:
+    # Same result as the line by line loop in _get_all_line_offsets(), but the file is read in large
+    # binary chunks that are split in C. The offsets are then computed with iterators (no Python
+    # code executed per line).
+    terminator_length = len(terminator)
+    # Bytes at the end of a chunk that may be the beginning of a terminator (\r of \r\n)
+    kept_length = terminator_length - 1
+
+    binary_file.seek(0, 0)
+    # Unless the file is empty, the first line starts at 0
+    line_offsets = array("L", [0])
+    carry = b""
+    position = 0  # Offset (in the file) of the first byte of data
+    for chunk in iter(lambda: binary_file.read(_SCAN_CHUNK_SIZE), b""):
+        data = carry + chunk
+        lines = data.split(terminator)
+        # Each complete line ends (and the next one starts) len(line) + len(terminator) bytes
+        # after the previous one.
+        line_ends = accumulate(
+            chain((position,), map(terminator_length.__add__, map(len, lines[:-1])))
+        )
+        next(line_ends)  # position is not a line end
+        line_offsets.extend(line_ends)
+
+        carry = lines[-1][len(lines[-1]) - kept_length :] if kept_length else b""
+        position += len(data) - len(carry)
+
+    file_size = position + len(carry)
+    if file_size == 0:
+        return array("L")
+
+    # There's no line after a terminator at the very end of the file
+    if line_offsets[-1] == file_size:
+        line_offsets.pop()
+    return line_offsets
@@ -108,11 +108,30 @@ class DwCAReader(object):
             self._directory_to_clean = None  # type: Optional[str]
         else:  # Archive is zipped/tgzipped, we have to extract it first.
             self._directory_to_clean, self._working_directory_path = self._extract()
+        # Made absolute once, so absolute_temporary_path() doesn't need to look up the current directory
+        self._working_directory_path = os.path.abspath(self._working_directory_path)
 
+        try:
+            self._open_archive_content(extensions_to_ignore, skip_metadata)
+        except Exception:
+            # Don't leave the extracted content (and opened files) behind if the archive turns out
+            # to be invalid.
+            self.close()
+            raise
+
+    def _open_archive_content(
+        self, extensions_to_ignore: List[str], skip_metadata: bool
+    ) -> None:
         #: An :class:`descriptors.ArchiveDescriptor` instance giving access to the archive
         #: descriptor/metafile (``meta.xml``)
         self.descriptor = None  # type: Optional[ArchiveDescriptor]
         self._metafile_handle = None
+        # The data files are opened at the end. If anything fails before, close() finds them unset.
+        #: An instance of :class:`dwca.files.CSVDataFile` for the core data file.
+        self.core_file = None  # type: CSVDataFile  # type: ignore
+        #: A list of :class:`dwca.files.CSVDataFile`, one entry for each extension data file , sorted by order of
+        #: appearance in the Metafile (or an empty list if the archive doesn't use extensions).
+        self.extension_files = []  # type: List[CSVDataFile]
         try:
             self._metafile_handle = self.open_included_file(self.default_metafile_name)
             self.descriptor = ArchiveDescriptor(
@@ -139,19 +158,17 @@ class DwCAReader(object):
         if (
             self.descriptor
         ):  # We have an Archive descriptor that we can use to access data files.
-            #: An instance of :class:`dwca.files.CSVDataFile` for the core data file.
             self.core_file = CSVDataFile(
                 self._working_directory_path, self.descriptor.core
-            )  # type: CSVDataFile
+            )
 
-            #: A list of :class:`dwca.files.CSVDataFile`, one entry for each extension data file , sorted by order of
-            #: appearance in the Metafile (or an empty list if the archive doesn't use extensions).
-            self.extension_files = [
-                CSVDataFile(
-                    work_directory=self._working_directory_path, file_descriptor=d
+            # Appended one by one, so close() finds those already opened if one of them fails.
+            for d in self.descriptor.extensions:
+                self.extension_files.append(
+                    CSVDataFile(
+                        work_directory=self._working_directory_path, file_descriptor=d
+                    )
                 )
-                for d in self.descriptor.extensions
-            ]  # type: List[CSVDataFile]
         else:  # Archive without descriptor, we'll have to find and inspect the data file
             try:
                 datafile_name = self._is_valid_simple_archive()
@@ -163,7 +180,6 @@ class DwCAReader(object):
                     work_directory=self._working_directory_path,
                     file_descriptor=descriptor,
                 )
-                self.extension_files = []
             except InvalidSimpleArchive:
                 msg = "No Metafile was found, but the archive contains multiple files/directories."
                 raise InvalidSimpleArchive(msg)
@@ -175,12 +191,15 @@ class DwCAReader(object):
         )
 
         if os.path.isdir(source_metadata_dir):
-            for f in os.listdir(source_metadata_dir):
-                if os.path.isfile(os.path.join(source_metadata_dir, f)):
-                    dataset_key = os.path.splitext(f)[0]
-                    source_metadata[dataset_key] = self._parse_xml_included_file(
-                        os.path.join(self.source_metadata_directory, f)
-                    )
+            # The directory entries tell us which ones are files, without an additional stat() call
+            # for each.
+            with os.scandir(source_metadata_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        dataset_key = os.path.splitext(entry.name)[0]
+                        source_metadata[dataset_key] = self._parse_xml_included_file(
+                            os.path.join(self.source_metadata_directory, entry.name)
+                        )
 
         return source_metadata
 
@@ -323,12 +342,20 @@ class DwCAReader(object):
             of the data publisher). In that case, this method don't guarantee which one will be
             returned. :meth:`.get_corerow_by_position` may be more appropriate in this case.
 
+        .. note::
+
+            The first call builds an index of the core file IDs (see :attr:`dwca.files.CSVDataFile.coreid_index`),
+            that makes subsequent lookups fast. For a large archive, this index takes time and memory.
         """
-        for row in self:
-            if row.id == str(row_id):
-                return row
+        if self.core_file.file_descriptor.id_index is None:  # No row has an ID
+            raise RowNotFound
+
+        # The index maps each core id to the position(s) of its row(s). Built at first use.
+        positions = self.core_file.coreid_index.get(str(row_id))
+        if not positions:
+            raise RowNotFound
 
-        raise RowNotFound
+        return self.get_corerow_by_position(positions[0])
 
     def get_corerow_by_position(self, position: int) -> CoreRow:
         """Return a core row according to its position/index in core file.
@@ -341,15 +368,20 @@ class DwCAReader(object):
 
         .. note::
 
-            - If index is bigger than the length of the archive, None is returned
+            - If position is bigger than the length of the archive, RowNotFound is raised
             - The position is often an appropriate way to unambiguously identify a core row in a DwCA.
 
         """
-        for i, row in enumerate(self):
-            if i == position:
-                return row
+        # Negative positions would be accepted by the line offsets index, but don't designate a row
+        if position < 0:
+            raise RowNotFound
 
-        raise RowNotFound
+        try:
+            row = self.core_file.get_row_by_position(position)
+        except IndexError:
+            raise RowNotFound
+
+        return self._link_core_row(row)
 
     def absolute_temporary_path(self, relative_path: str) -> str:
         """Return the absolute path of a file located within the archive.
@@ -374,7 +406,7 @@ class DwCAReader(object):
             File existence is not tested.
 
         """
-        return os.path.abspath(
+        return os.path.normpath(
             os.path.join(self._working_directory_path, relative_path)
         )
 
@@ -490,6 +522,7 @@ class DwCAReader(object):
                 # TODO: Once we only support Python 3.12+, we should pass the filter="data" argument to extractall()
                 tarfile.open(self.archive_path, "r:*").extractall(tmp_dir)
             except tarfile.ReadError:
+                remove_tree(tmp_dir)
                 raise InvalidArchive(
                     "The archive cannot be read. Is it a .zip or .tgz file?"
                 )
@@ -523,7 +556,8 @@ class DwCAReader(object):
 
         """
         #  Windows can't remove a dir with opened files
-        self.core_file.close()
+        if self.core_file is not None:  # Not opened if the constructor failed
+            self.core_file.close()
         for extension_file in self.extension_files:
             extension_file.close()
         if self._metafile_handle:
@@ -546,12 +580,14 @@ class DwCAReader(object):
     def next(self) -> CoreRow:  # NOQA
         try:
             row = self.core_file.get_row_by_position(self._corefile_pointer)
-
-            # Set up linked data so the CoreRow will know about them
-            row.link_extension_files(self.extension_files)
-            row.link_source_metadata(self.source_metadata)
-
-            self._corefile_pointer = self._corefile_pointer + 1
-            return row
         except IndexError:
             raise StopIteration
+
+        self._corefile_pointer = self._corefile_pointer + 1
+        return self._link_core_row(row)
+
+    def _link_core_row(self, row: CoreRow) -> CoreRow:
+        # Set up linked data so the CoreRow will know about them
+        row.link_extension_files(self.extension_files)
+        row.link_source_metadata(self.source_metadata)
+        return row
@@ -2,7 +2,7 @@
 
 import csv
 import sys
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from dwca.descriptors import DataFileDescriptor
 from dwca.exceptions import InvalidArchive
@@ -14,6 +14,9 @@ class Row(object):
     This class is intended to be subclassed rather than used directly.
     """
 
+    # Archives can have millions of rows: no per-instance __dict__
+    __slots__ = ("descriptor", "position", "rowtype", "raw_fields", "data")
+
     # Common ground for __str__ between subclasses
     def _build_str(self, source_str, id_str):
         txt = (
@@ -28,13 +31,12 @@ class Row(object):
             "--\n"
         )
 
-        extension_flag = (
-            "Yes"
-            if (hasattr(self, "extensions") and (len(self.extensions) > 0))
-            else "No"
-        )
+        # ExtensionRow has no extensions, and source_metadata only exists once
+        # CoreRow.link_source_metadata() has been called: a single getattr() with a default
+        # covers both the missing and the empty/None cases.
+        extension_flag = "Yes" if getattr(self, "extensions", None) else "No"
 
-        if hasattr(self, "source_metadata") and (self.source_metadata is not None):
+        if getattr(self, "source_metadata", None) is not None:
             source_metadata_flag = "Yes"
         else:
             source_metadata_flag = "No"
@@ -68,12 +70,7 @@ class Row(object):
 
         # self.raw_fields is a list of the csv_line's content
         #:
-        self.raw_fields = csv_line_to_fields(
-            csv_line,
-            line_ending=self.descriptor.lines_terminated_by,
-            field_ending=self.descriptor.fields_terminated_by,
-            fields_enclosed_by=self.descriptor.fields_enclosed_by,
-        )
+        self.raw_fields = split_line(csv_line, self.descriptor)
 
         # TODO: raw_fields is a new property: to test
 
@@ -91,28 +88,18 @@ class Row(object):
         #:      myrow.data['http://rs.tdwg.org/dwc/terms/locality']  # => "Brussels"
         #:
         #: .. note:: The :func:`dwca.darwincore.utils.qualname` helper is available to make such calls less verbose.
-        self.data = {}  # type: Dict[str, str]
+        self.data = dict(self.descriptor._default_data)  # type: Dict[str, str]
 
-        for field_descriptor in self.descriptor.fields:
+        # The template already contains the default value (or "") of each field: only the fields
+        # having a non-empty value in this row need to be set.
+        for term, column_index in self.descriptor._indexed_fields:
             try:
-                column_index = int(field_descriptor["index"])
                 field_row_value = self.raw_fields[column_index]
-            except TypeError:
-                # int() argument must be a string... We don't have an index for this field
-                field_row_value = None
             except IndexError:
-                msg = (
-                    "The descriptor references a non-existent field (index={i})".format(
-                        i=column_index
-                    )
-                )
-                raise InvalidArchive(msg)
+                raise _non_existent_field(column_index)
 
-            field_default_value = field_descriptor["default"]
-
-            self.data[field_descriptor["term"]] = (
-                field_row_value or field_default_value or ""
-            )
+            if field_row_value:
+                self.data[term] = field_row_value
 
 
 class CoreRow(Row):
@@ -123,6 +110,8 @@ class CoreRow(Row):
     looping over a :class:`dwca.read.DwCAReader` object.
     """
 
+    __slots__ = ("id", "_extensions", "source_metadata", "extension_data_files")
+
     def __str__(self) -> str:
         id_str = "Row id: " + str(self.id)
         return super(CoreRow, self)._build_str("Core file", id_str)
@@ -138,6 +127,8 @@ class CoreRow(Row):
         else:
             self.id = None
 
+        self._extensions = None  # type: Optional[List[ExtensionRow]]
+
     def link_source_metadata(self, archive_source_metadata):
         # If we have additional metadata about the dataset we're originally
         # from (AKA source/row-level metadata), make it accessible trough
@@ -155,11 +146,11 @@ class CoreRow(Row):
         #: for example).
         self.source_metadata = None
 
-        if archive_source_metadata and (field_name in self.data):
-            try:
-                self.source_metadata = archive_source_metadata[self.data[field_name]]
-            except KeyError:
-                pass
+        if archive_source_metadata:
+            # Still None if the row has no datasetID, or no metadata for it
+            self.source_metadata = archive_source_metadata.get(
+                self.data.get(field_name)
+            )
 
     def link_extension_files(self, extension_data_files):
         self.extension_data_files = extension_data_files
@@ -169,20 +160,17 @@ class CoreRow(Row):
         # type () -> List[ExtensionRow]
         """A list of :class:`.ExtensionRow` instances that relates to this Core row."""
         # We use lazy loading
-        if not hasattr(self, "_extensions"):
+        if self._extensions is None:
             self._extensions = []
             for csv_file in self.extension_data_files:
-                [
-                    self._extensions.append(r)
-                    for r in csv_file.get_all_rows_by_coreid(self.id)
-                ]
+                self._extensions.extend(csv_file.get_all_rows_by_coreid(self.id))
 
         return self._extensions
 
-    # __key is different between CoreRow and ExtensionRow, while eq, ne and hash are identical
-    # Should these 3 be factorized ? How ? Mixin ? Parent class ?
+    # __key is different between CoreRow and ExtensionRow, while eq and ne are identical
+    # Should these be factorized ? How ? Mixin ? Parent class ?
     def __key(self):
-        """Return a tuple representing the row. Common ground between equality and hash."""
+        """Return a tuple representing the row, used to test equality."""
         return (
             self.descriptor,
             self.id,
@@ -201,7 +189,9 @@ class CoreRow(Row):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self.__key())
+        # The full key contains the (unhashable) data dict and extensions list. Equal rows have
+        # the same descriptor, position and id, that's enough for hashing.
+        return hash((self.descriptor, self.position, self.id))
 
 
 class ExtensionRow(Row):
@@ -211,6 +201,8 @@ class ExtensionRow(Row):
     attribute of :class:`.CoreRow`.
     """
 
+    __slots__ = ("core_id",)
+
     def __str__(self):
         id_str = "Core row id: " + str(self.core_id)
         return super(ExtensionRow, self)._build_str("Extension file", id_str)
@@ -224,7 +216,7 @@ class ExtensionRow(Row):
         self.core_id = self.raw_fields[datafile_descriptor.coreid_index]
 
     def __key(self):
-        """Return a tuple representing the row. Common ground between equality and hash."""
+        """Return a tuple representing the row, used to test equality."""
         return (
             self.descriptor,
             self.core_id,
@@ -241,7 +233,28 @@ class ExtensionRow(Row):
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self.__key())
+        # The full key contains the (unhashable) data dict. Equal rows have the same descriptor,
+        # position and core id, that's enough for hashing.
+        return hash((self.descriptor, self.position, self.core_id))
+
+
+def split_line(csv_line: str, datafile_descriptor: DataFileDescriptor) -> List[str]:
+    """Split a line from the data file described by `datafile_descriptor`.
+
+    Return a list of fields, see :func:`csv_line_to_fields`.
+    """
+    return csv_line_to_fields(
+        csv_line,
+        line_ending=datafile_descriptor.lines_terminated_by,
+        field_ending=datafile_descriptor.fields_terminated_by,
+        fields_enclosed_by=datafile_descriptor.fields_enclosed_by,
+    )
+
+
+def _non_existent_field(index: int) -> InvalidArchive:
+    # Raised when a line lacks a column the descriptor declares
+    msg = "The descriptor references a non-existent field (index={i})".format(i=index)
+    return InvalidArchive(msg)
 
 
 def csv_line_to_fields(csv_line, line_ending, field_ending, fields_enclosed_by):
@@ -250,12 +263,17 @@ def csv_line_to_fields(csv_line, line_ending, field_ending, fields_enclosed_by):
     Return a list of fields. Content is not trimmed.
     """
     csv_line = csv_line.rstrip(line_ending)
-    raw_fields = []
 
     if fields_enclosed_by == "":
-        opts = {"quoting": csv.QUOTE_NONE}
-    else:
-        opts = {"quoting": csv.QUOTE_ALL, "quotechar": fields_enclosed_by}
+        # Without enclosing characters, there's nothing for the csv module to interpret: a plain
+        # split gives the same fields, faster, and also works with multi-character separators.
+        # (Like csv.reader, we ignore a remaining end of line, e.g. "\r" in a "\r\n" file
+        # declared as "\n"-terminated.)
+        csv_line = csv_line.rstrip("\r\n")
+        return csv_line.split(field_ending) if csv_line else []
+
+    raw_fields = []
+    opts = {"quoting": csv.QUOTE_ALL, "quotechar": fields_enclosed_by}
 
     for row in csv.reader([csv_line], delimiter=field_ending, **opts):
         for f in row:
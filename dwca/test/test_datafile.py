@@ -1,8 +1,11 @@
+import os
+import tempfile
 import unittest
 import xml.etree.ElementTree as ET
 from array import array
 
 from dwca.descriptors import DataFileDescriptor
+from dwca.exceptions import InvalidArchive
 from dwca.files import CSVDataFile
 from dwca.read import DwCAReader
 from .helpers import sample_data_path
@@ -160,3 +163,89 @@ class TestCSVDataFile(unittest.TestCase):
 
         for row in data_file:
             assert isinstance(row, str)
+
+    def test_iterate_skips_all_header_lines(self):
+        metaxml_section = r"""
+        <core encoding="utf-8" fieldsTerminatedBy="\t" linesTerminatedBy="\n" fieldsEnclosedBy="" ignoreHeaderLines="{lines}" rowType="http://rs.tdwg.org/dwc/terms/Occurrence">
+            <files><location>occurrence.txt</location></files>
+                <id index="0" />
+                <field index="1" term="http://rs.tdwg.org/dwc/terms/basisOfRecord"/>
+            </core>
+         """
+
+        descriptor = DataFileDescriptor.make_from_metafile_section(
+            ET.fromstring(metaxml_section.format(lines=3))
+        )
+        data_file = CSVDataFile(sample_data_path("dwca-simple-dir"), descriptor)
+
+        rows = list(data_file)
+        assert len(rows) == 2
+        assert rows[0].startswith("1\t")
+
+        # More header lines than lines in the file
+        descriptor = DataFileDescriptor.make_from_metafile_section(
+            ET.fromstring(metaxml_section.format(lines=10))
+        )
+        data_file = CSVDataFile(sample_data_path("dwca-simple-dir"), descriptor)
+
+        assert list(data_file) == []
+
+    def test_get_row_by_position_after_undecodable_bytes(self):
+        """Line offsets are correct even if the file contains bytes that can't be decoded."""
+        metaxml_section = r"""
+        <core encoding="utf-8" fieldsTerminatedBy="\t" linesTerminatedBy="\n" fieldsEnclosedBy="" ignoreHeaderLines="0" rowType="http://rs.tdwg.org/dwc/terms/Occurrence">
+            <files><location>occurrence.txt</location></files>
+            <id index="0" />
+            <field index="1" term="http://rs.tdwg.org/dwc/terms/locality"/>
+        </core>
+        """
+
+        descriptor = DataFileDescriptor.make_from_metafile_section(
+            ET.fromstring(metaxml_section)
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(os.path.join(tmp_dir, "occurrence.txt"), "wb") as f:
+                f.write(b"1\tBrux\xffelles\n2\tMumbai\n3\tBorneo\n")
+
+            data_file = CSVDataFile(tmp_dir, descriptor)
+            assert data_file.get_row_by_position(1).id == "2"
+            assert data_file.get_row_by_position(2).id == "3"
+            data_file.close()
+
+    def test_get_row_by_position_mixed_access(self):
+        """Sequential, random and iterator access to the same file can be mixed."""
+        with DwCAReader(sample_data_path("dwca-ids.zip")) as dwca:
+            core_file = dwca.core_file
+            ids = ["4", "1", "3", "2"]
+
+            assert [core_file.get_row_by_position(p).id for p in range(4)] == ids
+            assert core_file.get_row_by_position(2).id == "3"
+            assert core_file.get_row_by_position(0).id == "4"
+            assert len(list(core_file)) == 4
+            assert core_file.get_row_by_position(1).id == "1"
+            assert core_file.get_row_by_position(2).id == "3"
+
+    def test_coreid_index_short_line(self):
+        """A line lacking the coreid column raises InvalidArchive, as when building the row."""
+        metaxml_section = r"""
+        <extension encoding="utf-8" fieldsTerminatedBy="\t" linesTerminatedBy="\n" fieldsEnclosedBy="" ignoreHeaderLines="0" rowType="http://rs.gbif.org/terms/1.0/VernacularName">
+            <files><location>vernacularname.txt</location></files>
+            <coreid index="1" />
+            <field index="0" term="http://rs.tdwg.org/dwc/terms/vernacularName"/>
+        </extension>
+        """
+
+        descriptor = DataFileDescriptor.make_from_metafile_section(
+            ET.fromstring(metaxml_section)
+        )
+
+        for content in (b"Lion\t1\n\nTiger\t2\n", b"Lion\t1\nTiger\n"):
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                with open(os.path.join(tmp_dir, "vernacularname.txt"), "wb") as f:
+                    f.write(content)
+
+                data_file = CSVDataFile(tmp_dir, descriptor)
+                with pytest.raises(InvalidArchive):
+                    data_file.coreid_index
+                data_file.close()
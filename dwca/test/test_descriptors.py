@@ -176,6 +176,30 @@ class TestDataFileDescriptor(unittest.TestCase):
 
         assert len(core_descriptor.fields) == 5
 
+    def test_field_without_term(self):
+        metaxml_section = """
+        <core encoding="utf-8" fieldsTerminatedBy="\t" linesTerminatedBy="\n" fieldsEnclosedBy=""
+        ignoreHeaderLines="0" rowType="http://rs.tdwg.org/dwc/terms/Occurrence">
+            <files>
+                <location>occurrence.txt</location>
+            </files>
+            <id index="0" />
+            <field index="1"/>
+            <field index="2" term="http://rs.tdwg.org/dwc/terms/family"/>
+        </core>
+        """
+
+        core_descriptor = DataFileDescriptor.make_from_metafile_section(
+            ET.fromstring(metaxml_section)
+        )
+
+        assert {"term": None, "index": 1, "default": None} in core_descriptor.fields
+        assert core_descriptor.headers == [
+            "id",
+            None,
+            "http://rs.tdwg.org/dwc/terms/family",
+        ]
+
     def test_headers_simplecases(self):
         with DwCAReader(sample_data_path("dwca-2extensions.zip")) as dwca:
             descriptor = dwca.descriptor
@@ -286,6 +310,12 @@ class TestDataFileDescriptor(unittest.TestCase):
 
         assert core_descriptor.short_headers == expected_short_headers_core
 
+        # The cached headers can't be modified through the returned lists
+        core_descriptor.headers.append("extra")
+        core_descriptor.short_headers.sort()
+        assert core_descriptor.short_headers == expected_short_headers_core
+        assert len(core_descriptor.headers) == 5
+
     def test_headers_unordered(self):
         metaxml_section = """
         <core encoding="utf-8" fieldsTerminatedBy="\t" linesTerminatedBy="\n" fieldsEnclosedBy=""
@@ -565,6 +595,26 @@ class TestArchiveDescriptor(unittest.TestCase):
         d = ArchiveDescriptor(all_metaxml)
         assert len(d.extensions) == 0
 
+    def test_raw_element_without_namespace(self):
+        all_metaxml = """
+        <archive xmlns="http://rs.tdwg.org/dwc/text/" metadata="eml.xml">
+          <core encoding="utf-8" fieldsTerminatedBy="\t" linesTerminatedBy="\n" fieldsEnclosedBy="" ignoreHeaderLines="1" rowType="http://rs.tdwg.org/dwc/terms/Occurrence">
+            <files>
+              <location>occurrence.txt</location>
+            </files>
+            <id index="0" />
+            <field index="1" term="http://rs.tdwg.org/dwc/terms/basisOfRecord"/>
+          </core>
+        </archive>
+        """
+        d = ArchiveDescriptor(all_metaxml)
+
+        assert d.raw_element.tag == "archive"
+        assert (
+            d.raw_element.find("core").find("files/location").text == "occurrence.txt"
+        )
+        assert d.core.raw_element.tag == "core"
+
     def test_exposes_extensions_type(self):
         vn = "http://rs.gbif.org/terms/1.0/VernacularName"
         td = "http://rs.gbif.org/terms/1.0/Description"
@@ -352,6 +352,21 @@ class TestDwCAReader(unittest.TestCase):
         )
         assert str(cm.value) == expected_message
 
+    def test_invalid_archives_temporary_dir_removed(self):
+        """Ensure the temporary directory is removed when an archive can't be opened."""
+        tmp_dir = tempfile.gettempdir()
+        num_files_before = len(os.listdir(tmp_dir))
+
+        # Extracted, then found invalid
+        with pytest.raises(InvalidArchive):
+            DwCAReader(sample_data_path("dwca-invalid-simple-toomuch.zip"))
+        assert num_files_before == len(os.listdir(tmp_dir))
+
+        # Neither a zip nor a tar file
+        with pytest.raises(InvalidArchive):
+            DwCAReader(sample_data_path("description.rst"))
+        assert num_files_before == len(os.listdir(tmp_dir))
+
     def test_implicit_encoding_metadata(self):
         """If the metadata file doesn't specifies encoding, use UTF-8."""
         with DwCAReader(sample_data_path("dwca-simple-dir")) as dwca:
@@ -746,6 +761,20 @@ class TestDwCAReader(unittest.TestCase):
             with pytest.raises(RowNotFound):
                 dwca.get_corerow_by_position(1000)
 
+            with pytest.raises(RowNotFound):
+                dwca.get_corerow_by_position(-1)
+
+    def test_get_corerow_by_position_during_iteration(self):
+        """get_corerow_by_position() doesn't disturb an ongoing iteration, and links extensions"""
+        with DwCAReader(sample_data_path("dwca-2extensions.zip")) as dwca:
+            ids = []
+            for row in dwca:
+                ids.append(row.id)
+                assert dwca.get_corerow_by_position(0).id == "1"
+
+            assert ids == ["1", "2", "3", "4"]
+            assert len(dwca.get_corerow_by_position(0).extensions) == 5
+
     def test_get_corerow_by_id_string(self):
         genus_qn = "http://rs.tdwg.org/dwc/terms/genus"
 
@@ -774,6 +803,29 @@ class TestDwCAReader(unittest.TestCase):
             r = dwca.get_corerow_by_id(3)
             assert "Peliperdix" == r.data[genus_qn]
 
+    def test_get_corerow_by_id_line_without_id(self):
+        """A line lacking the id column raises InvalidArchive, as when iterating the archive."""
+        metaxml = r"""
+        <archive xmlns="http://rs.tdwg.org/dwc/text/">
+          <core encoding="utf-8" fieldsTerminatedBy="\t" linesTerminatedBy="\n" fieldsEnclosedBy="" ignoreHeaderLines="0" rowType="http://rs.tdwg.org/dwc/terms/Occurrence">
+            <files><location>occurrence.txt</location></files>
+            <id index="2" />
+            <field index="0" term="http://rs.tdwg.org/dwc/terms/locality"/>
+            <field index="1" term="http://rs.tdwg.org/dwc/terms/family"/>
+          </core>
+        </archive>
+        """
+
+        with tempfile.TemporaryDirectory() as archive_dir:
+            with open(os.path.join(archive_dir, "meta.xml"), "w") as f:
+                f.write(metaxml)
+            with open(os.path.join(archive_dir, "occurrence.txt"), "w") as f:
+                f.write("a\tb\t1\nc\td\ne\tf\t3\n")
+
+            with DwCAReader(archive_dir) as dwca:
+                with pytest.raises(InvalidArchive):
+                    dwca.get_corerow_by_id("3")
+
     def test_get_inexistent_row(self):
         """Ensure get_corerow_by_id() raises RowNotFound if we ask it an unexistent row."""
         with DwCAReader(sample_data_path("dwca-ids.zip")) as dwca:
@@ -14,6 +14,22 @@ class TestUtils(unittest.TestCase):
         assert raw_fields[1] == "field 2, with comma"
         assert raw_fields[2] == "field 3"
 
+    def test_csv_line_to_fields_not_enclosed(self):
+        raw_fields = csv_line_to_fields(
+            'field 1\t"field 2"\t\tfield 4\n', "\n", "\t", ""
+        )
+        assert raw_fields == ["field 1", '"field 2"', "", "field 4"]
+
+        # A file with \r\n line endings declared as "\n"-terminated
+        raw_fields = csv_line_to_fields("field 1\tfield 2\r\n", "\n", "\t", "")
+        assert raw_fields == ["field 1", "field 2"]
+
+        # Multi-character separator
+        raw_fields = csv_line_to_fields("field 1|~|field 2\n", "\n", "|~|", "")
+        assert raw_fields == ["field 1", "field 2"]
+
+        assert csv_line_to_fields("\n", "\n", "\t", "") == []
+
 
 class TestCoreRow(unittest.TestCase):
     def test_position(self):
@@ -28,6 +44,18 @@ class TestCoreRow(unittest.TestCase):
                 for i, row in enumerate(dwca):
                     assert i == row.position
 
+    def test_hashable(self):
+        with DwCAReader(sample_data_path("dwca-2extensions.zip")) as dwca:
+            rows = dwca.rows
+            same_rows = dwca.rows
+
+            assert len({*rows, *same_rows}) == len(rows)
+            assert hash(rows[0]) == hash(same_rows[0])
+
+            extension_rows = rows[0].extensions
+            assert len(set(extension_rows)) == len(extension_rows)
+            assert extension_rows[0] in set(same_rows[0].extensions)
+
 
 class TestExtensionRow(unittest.TestCase):
     def test_position(self):